@@ -1709,9 +1709,10 @@ class _Generator(Generator):
         ]
 
         for pattern, definition in functions:
-            is_in_helpers = any([pattern in helper for helper in helpers])
+            # Helpers are short, so search them before the definitions.
+            is_in_helpers = any(pattern in helper for helper in helpers)
 
-            if pattern in definitions or is_in_helpers:
+            if is_in_helpers or pattern in definitions:
                 helpers.insert(0, definition)
 
         for additional_helpers in self.additional_helpers.values():
@@ -84,6 +84,7 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     ssize_t pos;
     size_t byte_pos;
     size_t pos_in_byte;
+    uint8_t byte;
 
     pos = encoder_alloc(self_p, 8u * size);
 
@@ -97,10 +98,14 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     if (pos_in_byte == 0u) {
         (void)memcpy(&self_p->buf_p[byte_pos], buf_p, size);
     } else {
+        byte = self_p->buf_p[byte_pos];
+
         for (i = 0; i < size; i++) {
-            self_p->buf_p[byte_pos + i] |= (buf_p[i] >> pos_in_byte);
-            self_p->buf_p[byte_pos + i + 1] = (buf_p[i] << (8u - pos_in_byte));
+            self_p->buf_p[byte_pos + i] = (uint8_t)(byte | (buf_p[i] >> pos_in_byte));
+            byte = (uint8_t)(buf_p[i] << (8u - pos_in_byte));
         }
+
+        self_p->buf_p[byte_pos + size] = byte;
     }
 }\
 '''
@@ -168,7 +173,7 @@ ENCODER_APPEND_INT8 = '''
 static void encoder_append_int8(struct encoder_t *self_p,
                                 int8_t value)
 {
-    encoder_append_uint8(self_p, (uint8_t)value + 128);
+    encoder_append_uint8(self_p, (uint8_t)((uint8_t)value ^ 0x80u));
 }\
 '''
 
@@ -176,7 +181,7 @@ ENCODER_APPEND_INT16 = '''
 static void encoder_append_int16(struct encoder_t *self_p,
                                  int16_t value)
 {
-    encoder_append_uint16(self_p, (uint16_t)value + 32768);
+    encoder_append_uint16(self_p, (uint16_t)((uint16_t)value ^ 0x8000u));
 }\
 '''
 
@@ -184,7 +189,7 @@ ENCODER_APPEND_INT32 = '''
 static void encoder_append_int32(struct encoder_t *self_p,
                                  int32_t value)
 {
-    encoder_append_uint32(self_p, (uint32_t)value + 2147483648);
+    encoder_append_uint32(self_p, (uint32_t)value ^ 0x80000000u);
 }\
 '''
 
@@ -192,12 +197,7 @@ ENCODER_APPEND_INT64 = '''
 static void encoder_append_int64(struct encoder_t *self_p,
                                  int64_t value)
 {
-    uint64_t u64_value;
-
-    u64_value = (uint64_t)value;
-    u64_value += 9223372036854775808ull;
-
-    encoder_append_uint64(self_p, u64_value);
+    encoder_append_uint64(self_p, (uint64_t)value ^ 0x8000000000000000ull);
 }\
 '''
 
@@ -213,10 +213,42 @@ static void encoder_append_non_negative_binary_integer(struct encoder_t *self_p,
                                                        uint64_t value,
                                                        size_t size)
 {
-    size_t i;
+    ssize_t pos;
+    size_t byte_pos;
+    size_t pos_in_byte;
+    size_t number_of_bits;
+
+    pos = encoder_alloc(self_p, size);
+
+    if (pos < 0) {
+        return;
+    }
+
+    byte_pos = ((size_t)pos / 8u);
+    pos_in_byte = ((size_t)pos % 8u);
+
+    if ((pos_in_byte != 0u) && (size > 0u)) {
+        number_of_bits = (8u - pos_in_byte);
+
+        if (number_of_bits > size) {
+            number_of_bits = size;
+        }
 
-    for (i = 0; i < size; i++) {
-        encoder_append_bit(self_p, (value >> (size - i - 1)) & 1);
+        size -= number_of_bits;
+        self_p->buf_p[byte_pos] |= (uint8_t)(
+            ((value >> size) & ((1u << number_of_bits) - 1u))
+            << (8u - pos_in_byte - number_of_bits));
+        byte_pos++;
+    }
+
+    while (size >= 8u) {
+        size -= 8u;
+        self_p->buf_p[byte_pos] = (uint8_t)(value >> size);
+        byte_pos++;
+    }
+
+    if (size > 0u) {
+        self_p->buf_p[byte_pos] = (uint8_t)(value << (8u - size));
     }
 }\
 '''
@@ -288,6 +320,8 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     ssize_t pos;
     size_t byte_pos;
     size_t pos_in_byte;
+    uint8_t byte;
+    uint8_t next_byte;
 
     pos = decoder_free(self_p, 8u * size);
 
@@ -301,9 +335,13 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     if (pos_in_byte == 0) {
         (void)memcpy(buf_p, &self_p->buf_p[byte_pos], size);
     } else {
+        byte = self_p->buf_p[byte_pos];
+
         for (i = 0; i < size; i++) {
-            buf_p[i] = (self_p->buf_p[byte_pos + i] << pos_in_byte);
-            buf_p[i] |= (self_p->buf_p[byte_pos + i + 1] >> (8u - pos_in_byte));
+            next_byte = self_p->buf_p[byte_pos + i + 1];
+            buf_p[i] = (uint8_t)((byte << pos_in_byte)
+                                 | (next_byte >> (8u - pos_in_byte)));
+            byte = next_byte;
         }
     }
 }\
@@ -366,48 +404,28 @@ static uint64_t decoder_read_uint64(struct decoder_t *self_p)
 DECODER_READ_INT8 = '''
 static int8_t decoder_read_int8(struct decoder_t *self_p)
 {
-    int8_t value;
-
-    value = (int8_t)decoder_read_uint8(self_p);
-    value -= 128;
-
-    return (value);
+    return ((int8_t)(decoder_read_uint8(self_p) ^ 0x80u));
 }\
 '''
 
 DECODER_READ_INT16 = '''
 static int16_t decoder_read_int16(struct decoder_t *self_p)
 {
-    int16_t value;
-
-    value = (int16_t)decoder_read_uint16(self_p);
-    value -= 32768;
-
-    return (value);
+    return ((int16_t)(decoder_read_uint16(self_p) ^ 0x8000u));
 }\
 '''
 
 DECODER_READ_INT32 = '''
 static int32_t decoder_read_int32(struct decoder_t *self_p)
 {
-    int32_t value;
-
-    value = (int32_t)decoder_read_uint32(self_p);
-    value -= 2147483648;
-
-    return (value);
+    return ((int32_t)(decoder_read_uint32(self_p) ^ 0x80000000u));
 }\
 '''
 
 DECODER_READ_INT64 = '''
 static int64_t decoder_read_int64(struct decoder_t *self_p)
 {
-    uint64_t value;
-
-    value = decoder_read_uint64(self_p);
-    value -= 9223372036854775808ull;
-
-    return ((int64_t)value);
+    return ((int64_t)(decoder_read_uint64(self_p) ^ 0x8000000000000000ull));
 }\
 '''
 
@@ -422,14 +440,45 @@ DECODER_READ_NON_NEGATIVE_BINARY_INTEGER = '''
 static uint64_t decoder_read_non_negative_binary_integer(struct decoder_t *self_p,
                                                          size_t size)
 {
-    size_t i;
+    ssize_t pos;
+    size_t byte_pos;
+    size_t pos_in_byte;
+    size_t number_of_bits;
     uint64_t value;
 
+    pos = decoder_free(self_p, size);
+
+    if (pos < 0) {
+        return (0);
+    }
+
+    byte_pos = ((size_t)pos / 8u);
+    pos_in_byte = ((size_t)pos % 8u);
     value = 0;
 
-    for (i = 0; i < size; i++) {
-        value <<= 1;
-        value |= (uint64_t)decoder_read_bit(self_p);
+    if ((pos_in_byte != 0u) && (size > 0u)) {
+        number_of_bits = (8u - pos_in_byte);
+
+        if (number_of_bits > size) {
+            number_of_bits = size;
+        }
+
+        size -= number_of_bits;
+        value = ((self_p->buf_p[byte_pos] >> (8u - pos_in_byte - number_of_bits))
+                 & ((1u << number_of_bits) - 1u));
+        byte_pos++;
+    }
+
+    while (size >= 8u) {
+        size -= 8u;
+        value <<= 8;
+        value |= self_p->buf_p[byte_pos];
+        byte_pos++;
+    }
+
+    if (size > 0u) {
+        value <<= size;
+        value |= (uint64_t)(self_p->buf_p[byte_pos] >> (8u - size));
     }
 
     return (value);
@@ -443,6 +492,24 @@ def does_bits_match_range(number_of_bits, minimum, maximum):
 
 class _Generator(Generator):
 
+    def __init__(self, namespace):
+        super(_Generator, self).__init__(namespace)
+        # Types formatted inline even if they are user types.
+        self.inline_format_inner_by_class = {
+            uper.Integer: self.format_integer_inner,
+            uper.Real: lambda type_, checker: self.format_real_inner(),
+            uper.Null: lambda type_, checker: ([], []),
+            uper.Boolean: lambda type_, checker: self.format_boolean_inner()
+        }
+        self.format_inner_by_class = {
+            uper.OctetString: self.format_octet_string_inner,
+            uper.Sequence: self.format_sequence_inner,
+            uper.Choice: self.format_choice_inner,
+            uper.SequenceOf: self.format_sequence_of_inner,
+            uper.Enumerated: lambda type_, checker: self.format_enumerated_inner(type_),
+            uper.BitString: lambda type_, checker: self.format_bit_string_inner(type_)
+        }
+
     def format_real(self):
         return []
 
@@ -563,49 +630,101 @@ class _Generator(Generator):
                 ]
             )
         else:
-            return (
-                [
-                    'encoder_append_non_negative_binary_integer(',
-                    '    encoder_p,',
-                    '    (uint64_t)(src_p->{} - {}),'.format(location, checker.minimum),
-                    '    {});'.format(type_.number_of_bits)
-                ],
-                [
-                    'dst_p->{} = decoder_read_non_negative_binary_integer('.format(
-                        location),
-                    '    decoder_p,',
-                    '    {});'.format(type_.number_of_bits),
-                    'dst_p->{} += {};'.format(location, checker.minimum)
-                ]
-            )
+            encode_lines, decode_lines = self.format_non_negative_binary_integer_inner(
+                '(uint64_t)(src_p->{} - {})'.format(location, checker.minimum),
+                'dst_p->{}'.format(location),
+                type_.number_of_bits,
+                type_name)
+            decode_lines.append('dst_p->{} += {};'.format(location, checker.minimum))
 
-    def format_bit_string_inner(self, type_):
-        location = self.location_inner()
+            return encode_lines, decode_lines
+
+    def format_non_negative_binary_integer_inner(self,
+                                                 value,
+                                                 destination,
+                                                 number_of_bits,
+                                                 type_name=None):
+        """Encode given value and decode it into given destination as a
+        non-negative binary integer of given number of bits.
+
+        """
 
         return (
-            [
+            self.format_non_negative_binary_integer_encode(value,
+                                                           number_of_bits),
+            self.format_non_negative_binary_integer_decode(destination,
+                                                           number_of_bits,
+                                                           type_name)
+        )
+
+    def format_non_negative_binary_integer_encode(self, value, number_of_bits):
+        """Single bits and whole bytes have dedicated helpers that are
+        cheaper than the generic non-negative binary integer encoder.
+
+        """
+
+        if number_of_bits == 1:
+            return ['encoder_append_bit(encoder_p, (int)({}));'.format(value)]
+        elif number_of_bits == 8:
+            return ['encoder_append_uint8(encoder_p, (uint8_t)({}));'.format(value)]
+        else:
+            return [
                 'encoder_append_non_negative_binary_integer(',
                 '    encoder_p,',
-                '    (uint64_t)(src_p->{}),'.format(location),
-                '    {});'.format(type_.maximum)
-            ],
-            [
-                'dst_p->{} = decoder_read_non_negative_binary_integer('.format(
-                    location),
+                '    {},'.format(value),
+                '    {});'.format(number_of_bits)
+            ]
+
+    def format_non_negative_binary_integer_decode(self,
+                                                  destination,
+                                                  number_of_bits,
+                                                  type_name=None):
+        """The decoded value is cast to given type name, if any.
+
+        """
+
+        if type_name is None:
+            cast = ''
+        else:
+            cast = '({})'.format(type_name)
+
+        if number_of_bits == 1:
+            return [
+                '{} = ({})decoder_read_bit(decoder_p);'.format(destination,
+                                                               type_name or 'uint8_t')
+            ]
+        elif number_of_bits == 8:
+            if type_name == 'uint8_t':
+                cast = ''
+
+            return [
+                '{} = {}decoder_read_uint8(decoder_p);'.format(destination, cast)
+            ]
+        else:
+            return [
+                '{} = {}decoder_read_non_negative_binary_integer('.format(destination,
+                                                                          cast),
                 '    decoder_p,',
-                '    {});'.format(type_.maximum)
+                '    {});'.format(number_of_bits)
             ]
-        )
+
+    def format_bit_string_inner(self, type_):
+        location = self.location_inner()
+
+        return self.format_non_negative_binary_integer_inner(
+            '(uint64_t)(src_p->{})'.format(location),
+            'dst_p->{}'.format(location),
+            type_.maximum)
 
     def format_boolean_inner(self):
+        location = self.location_inner()
+
         return (
             [
-                'encoder_append_bool(encoder_p, src_p->{});'.format(
-                    self.location_inner())
+                'encoder_append_bool(encoder_p, src_p->{});'.format(location)
             ],
             [
-                'dst_p->{} = decoder_read_bool(decoder_p);'.format(
-                    self.location_inner())
+                'dst_p->{} = decoder_read_bool(decoder_p);'.format(location)
             ]
         )
 
@@ -635,29 +754,30 @@ class _Generator(Generator):
             else:
                 decode_lines.append('decoder_read_bool(decoder_p);')
 
+        present_bits = []
+        location = self.location_inner('', '.')
+
         for member in type_.root_members:
             if member.optional:
-                name = '{}is_{}_present'.format(self.location_inner('', '.'),
-                                                member.name)
-                encode_lines.append(
-                    'encoder_append_bool(encoder_p, src_p->{});'.format(
-                        name))
-                decode_lines.append(
-                    'dst_p->{} = decoder_read_bool(decoder_p);'.format(
-                        name))
+                name = '{}is_{}_present'.format(location, member.name)
+                present_bits.append(('src_p->{}'.format(name),
+                                     'dst_p->{}'.format(name)))
             elif member.default is not None:
                 unique_is_present = self.add_unique_decode_variable('bool {};',
                                                                     'is_present')
                 member_name_to_is_present[member.name] = unique_is_present
-                encode_lines.append(
-                    'encoder_append_bool(encoder_p, src_p->{}{}{} != {});'.format(
-                        self.location_inner('', '.'),
+                present_bits.append((
+                    'src_p->{}{}{} != {}'.format(
+                        location,
                         member.name,
                         '.value' if self.is_complex_user_type(member) else '',
-                        self.format_default(member)))
-                decode_lines.append(
-                    '{} = decoder_read_bool(decoder_p);'.format(
-                        unique_is_present))
+                        self.format_default(member)),
+                    unique_is_present))
+
+        (present_bits_encode_lines,
+         present_bits_decode_lines) = self.format_present_bits_inner(present_bits)
+        encode_lines += present_bits_encode_lines
+        decode_lines += present_bits_decode_lines
 
         for member in type_.root_members:
             (member_encode_lines,
@@ -677,6 +797,56 @@ class _Generator(Generator):
 
         return encode_lines, decode_lines
 
+    def format_present_bits_inner(self, present_bits):
+        """Encode and decode given list of (condition, destination)
+        presence bits. Consecutive bits are packed into a mask that is
+        encoded and decoded in one call, up to 64 bits at a time.
+
+        """
+
+        encode_lines = []
+        decode_lines = []
+
+        for offset in range(0, len(present_bits), 64):
+            chunk = present_bits[offset:offset + 64]
+            number_of_bits = len(chunk)
+
+            if number_of_bits == 1:
+                condition, destination = chunk[0]
+                encode_lines.append(
+                    'encoder_append_bool(encoder_p, {});'.format(condition))
+                decode_lines.append(
+                    '{} = decoder_read_bool(decoder_p);'.format(destination))
+                continue
+
+            unique_present_mask = self.add_unique_variable('uint64_t {};',
+                                                           'present_mask')
+            shifts = range(number_of_bits - 1, -1, -1)
+            encode_fmt = '{} |= ((uint64_t)({{}}) << {{}});'.format(
+                unique_present_mask)
+            decode_fmt = '{{}} = ((({} >> {{}}) & 1u) != 0);'.format(
+                unique_present_mask)
+            encode_lines.append('{} = 0;'.format(unique_present_mask))
+            encode_lines += [
+                encode_fmt.format(condition, shift)
+                for (condition, _), shift in zip(chunk, shifts)
+            ]
+
+            (mask_encode_lines,
+             mask_decode_lines) = self.format_non_negative_binary_integer_inner(
+                 unique_present_mask,
+                 unique_present_mask,
+                 number_of_bits)
+            encode_lines += mask_encode_lines
+            decode_lines += mask_decode_lines
+
+            decode_lines += [
+                decode_fmt.format(destination, shift)
+                for (_, destination), shift in zip(chunk, shifts)
+            ]
+
+        return encode_lines, decode_lines
+
     def format_octet_string_inner(self, type_, checker):
         location = self.location_inner('', '.')
 
@@ -692,22 +862,17 @@ class _Generator(Generator):
                 '                   {});'.format(checker.maximum)
             ]
         else:
-            encode_lines = [
-                'encoder_append_non_negative_binary_integer(',
-                '    encoder_p,',
-                '    src_p->{}length - {}u,'.format(location, checker.minimum),
-                '    {});'.format(type_.number_of_bits),
+            encode_lines, decode_lines = self.format_non_negative_binary_integer_inner(
+                'src_p->{}length - {}u'.format(location, checker.minimum),
+                'dst_p->{}length'.format(location),
+                type_.number_of_bits)
+            encode_lines += [
                 'encoder_append_bytes(encoder_p,',
                 '                     &src_p->{}buf[0],'.format(location),
                 '                     src_p->{}length);'.format(location)
             ]
-            decode_lines = [
-                'dst_p->{}length = decoder_read_non_negative_binary_integer('.format(
-                    location),
-                '    decoder_p,',
-                '    {});'.format(type_.number_of_bits),
-                'dst_p->{}length += {}u;'.format(location, checker.minimum)
-            ]
+            decode_lines.append(
+                'dst_p->{}length += {}u;'.format(location, checker.minimum))
 
             if not does_bits_match_range(type_.number_of_bits,
                                          checker.minimum,
@@ -736,15 +901,12 @@ class _Generator(Generator):
         prefix = '{}_{}_{}'.format(self.namespace,
                                    module_name_snake,
                                    type_name_snake)
+        location = self.location_inner()
         encode_lines = [
-            '{}_encode_inner(encoder_p, &src_p->{});'.format(
-                prefix,
-                self.location_inner())
+            '{}_encode_inner(encoder_p, &src_p->{});'.format(prefix, location)
         ]
         decode_lines = [
-            '{}_decode_inner(decoder_p, &dst_p->{});'.format(
-                prefix,
-                self.location_inner())
+            '{}_decode_inner(decoder_p, &dst_p->{});'.format(prefix, location)
         ]
 
         return encode_lines, decode_lines
@@ -757,6 +919,10 @@ class _Generator(Generator):
             '{} {{}};'.format(type_name),
             'choice')
         choice = '{}choice'.format(self.location_inner('', '.'))
+        index_fmt = ('encoder_append_non_negative_binary_integer(encoder_p, '
+                     '{{}}, {});'.format(type_.root_number_of_bits))
+        case_fmt = 'case {}_choice_{{}}_e:'.format(self.location)
+        choice_fmt = 'dst_p->{} = {}_choice_{{}}_e;'.format(choice, self.location)
 
         for member in type_.root_index_to_member.values():
             member_checker = self.get_member_checker(checker,
@@ -772,22 +938,18 @@ class _Generator(Generator):
             index = type_.root_name_to_index[member.name]
 
             choice_encode_lines = [
-                'encoder_append_non_negative_binary_integer(encoder_p, {}, {});'.format(
-                    index,
-                    type_.root_number_of_bits)
+                index_fmt.format(index)
             ] + choice_encode_lines + [
                 'break;'
             ]
             encode_lines += [
-                'case {}_choice_{}_e:'.format(self.location, member.name)
+                case_fmt.format(member.name)
             ] + indent_lines(choice_encode_lines) + [
                 ''
             ]
 
             choice_decode_lines = [
-                'dst_p->{} = {}_choice_{}_e;'.format(choice,
-                                                     self.location,
-                                                     member.name)
+                choice_fmt.format(member.name)
             ] + choice_decode_lines + [
                 'break;'
             ]
@@ -809,11 +971,10 @@ class _Generator(Generator):
             ''
         ]
 
-        decode_lines = [
-            '{} = ({})decoder_read_non_negative_binary_integer(decoder_p, {});'.format(
-                unique_choice,
-                type_name,
-                type_.root_number_of_bits),
+        decode_lines = self.format_non_negative_binary_integer_decode(
+            unique_choice,
+            type_.root_number_of_bits,
+            type_name) + [
             '',
             'switch ({}) {{'.format(unique_choice),
             ''
@@ -855,14 +1016,13 @@ class _Generator(Generator):
         else:
             encode_lines = ['{} = src_p->{};'.format(unique_value, location)]
 
-        encode_lines.append('encoder_append_non_negative_binary_integer(encoder_p, '
-                            '{}, {});'.format(unique_value, type_.root_number_of_bits))
-
-        decode_lines = [
-            '{} = decoder_read_non_negative_binary_integer('
-            'decoder_p, {});'.format(unique_value,
-                                     type_.root_number_of_bits)
-        ]
+        (value_encode_lines,
+         decode_lines) = self.format_non_negative_binary_integer_inner(
+             unique_value,
+             unique_value,
+             type_.root_number_of_bits,
+             type_name)
+        encode_lines += value_encode_lines
 
         if bin(len(self.get_enumerated_values(type_))).count('1') != 1 and (not
            value_mapping_required):
@@ -931,21 +1091,18 @@ class _Generator(Generator):
             ]
         else:
             location = self.location_inner('', '.')
-            first_encode_lines = [
-                'encoder_append_non_negative_binary_integer(',
-                '    encoder_p,',
-                '    src_p->{}length - {}u,'.format(location, checker.minimum),
-                '    {});'.format(type_.number_of_bits),
+            (first_encode_lines,
+             first_decode_lines) = self.format_non_negative_binary_integer_inner(
+                 'src_p->{}length - {}u'.format(location, checker.minimum),
+                 'dst_p->{}length'.format(location),
+                 type_.number_of_bits)
+            first_encode_lines += [
                 '',
                 'for ({0} = 0; {0} < src_p->{1}length; {0}++) {{'.format(
                     unique_i,
                     location)
             ]
-            first_decode_lines = [
-                'dst_p->{}length = decoder_read_non_negative_binary_integer('.format(
-                    location),
-                '    decoder_p,',
-                '    {});'.format(type_.number_of_bits),
+            first_decode_lines += [
                 'dst_p->{}length += {}u;'.format(location, checker.minimum),
                 ''
             ]
@@ -974,29 +1131,15 @@ class _Generator(Generator):
         return encode_lines, decode_lines
 
     def format_type_inner(self, type_, checker):
-        if isinstance(type_, uper.Integer):
-            return self.format_integer_inner(type_, checker)
-        elif isinstance(type_, uper.Real):
-            return self.format_real_inner()
-        elif isinstance(type_, uper.Null):
-            return [], []
-        elif isinstance(type_, uper.Boolean):
-            return self.format_boolean_inner()
+        type_class = type(type_)
+
+        if type_class in self.inline_format_inner_by_class:
+            return self.inline_format_inner_by_class[type_class](type_, checker)
         elif is_user_type(type_):
             return self.format_user_type_inner(type_.type_name,
                                                type_.module_name)
-        elif isinstance(type_, uper.OctetString):
-            return self.format_octet_string_inner(type_, checker)
-        elif isinstance(type_, uper.Sequence):
-            return self.format_sequence_inner(type_, checker)
-        elif isinstance(type_, uper.Choice):
-            return self.format_choice_inner(type_, checker)
-        elif isinstance(type_, uper.SequenceOf):
-            return self.format_sequence_of_inner(type_, checker)
-        elif isinstance(type_, uper.Enumerated):
-            return self.format_enumerated_inner(type_)
-        elif isinstance(type_, uper.BitString):
-            return self.format_bit_string_inner(type_)
+        elif type_class in self.format_inner_by_class:
+            return self.format_inner_by_class[type_class](type_, checker)
         else:
             raise self.error(type_)
 
@@ -1049,9 +1192,10 @@ class _Generator(Generator):
         ]
 
         for pattern, definition in functions:
-            is_in_helpers = any([pattern in helper for helper in helpers])
+            # Helpers are short, so search them before the definitions.
+            is_in_helpers = any(pattern in helper for helper in helpers)
 
-            if pattern in definitions or is_in_helpers:
+            if is_in_helpers or pattern in definitions:
                 helpers.insert(0, definition)
 
         return [ENCODER_AND_DECODER_STRUCTS] + helpers + ['']
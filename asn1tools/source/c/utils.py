@@ -124,24 +124,47 @@ static void decoder_abort(struct decoder_t *self_p,
 }\
 '''
 
+_SNAKE_CASE_BY_CAMEL_CASE = {}
+
 
 class _MembersBacktracesContext(object):
+    """Push given member name to given backtraces. Each backtrace is a
+    tuple of a list of member names, a list of the member names joined
+    with given separator at each depth, and the separator.
+
+    """
 
     def __init__(self, backtraces, member_name):
         self.backtraces = backtraces
         self.member_name = member_name
 
     def __enter__(self):
-        for backtrace in self.backtraces:
+        for backtrace, joined_backtrace, separator in self.backtraces:
             backtrace.append(self.member_name)
 
+            if joined_backtrace:
+                joined_backtrace.append(
+                    joined_backtrace[-1] + separator + self.member_name)
+            else:
+                joined_backtrace.append(self.member_name)
+
     def __exit__(self, *args):
-        for backtrace in self.backtraces:
+        for backtrace, joined_backtrace, _ in self.backtraces:
             backtrace.pop()
+            joined_backtrace.pop()
 
 
 class _UserType(object):
 
+    __slots__ = (
+        'type_name',
+        'module_name',
+        'type_declaration',
+        'declaration',
+        'definition_inner',
+        'definition'
+    )
+
     def __init__(self,
                  type_name,
                  module_name,
@@ -162,32 +185,27 @@ class Generator(object):
     def __init__(self, namespace):
         self.namespace = canonical(namespace)
         self.asn1_members_backtrace = []
+        self.asn1_members_backtrace_joined = []
         self.c_members_backtrace = []
+        self.c_members_backtrace_joined = []
         self.module_name = None
+        self.module_name_snake = None
         self.type_name = None
+        self.type_name_snake = None
         self.helper_lines = []
         self.base_variables = set()
         self.used_suffixes_by_base_variables = {}
-        self.encode_variable_lines = []
-        self.decode_variable_lines = []
+        self.variables = []
         self.used_user_types = []
+        self.type_names_by_range = {}
 
     def reset_type(self):
         self.helper_lines = []
         self.base_variables = set()
         self.used_suffixes_by_base_variables = {}
-        self.encode_variable_lines = []
-        self.decode_variable_lines = []
+        self.variables = []
         self.used_user_types = []
 
-    @property
-    def module_name_snake(self):
-        return camel_to_snake_case(self.module_name)
-
-    @property
-    def type_name_snake(self):
-        return camel_to_snake_case(self.type_name)
-
     def type_length(self, minimum, maximum):
         # Make sure it fits in 64 bits.
         if minimum < -9223372036854775808:
@@ -245,12 +263,19 @@ class Generator(object):
         return length
 
     def format_type_name(self, minimum, maximum):
+        try:
+            return self.type_names_by_range[(minimum, maximum)]
+        except KeyError:
+            pass
+
         length = self.type_length(minimum, maximum)
         type_name = 'int{}_t'.format(length)
 
         if minimum >= 0:
             type_name = 'u' + type_name
 
+        self.type_names_by_range[(minimum, maximum)] = type_name
+
         return type_name
 
     def format_default_enumerated(self, type_):
@@ -287,14 +312,14 @@ class Generator(object):
                                      self.module_name_snake,
                                      self.type_name_snake)
 
-        if self.asn1_members_backtrace:
-            location += '_{}'.format('_'.join(self.asn1_members_backtrace))
+        if self.asn1_members_backtrace_joined:
+            location += '_' + self.asn1_members_backtrace_joined[-1]
 
         return location
 
     def location_inner(self, default='value', end=''):
-        if self.c_members_backtrace:
-            return '.'.join(self.c_members_backtrace) + end
+        if self.c_members_backtrace_joined:
+            return self.c_members_backtrace_joined[-1] + end
         else:
             return default
 
@@ -308,22 +333,32 @@ class Generator(object):
 
     def members_backtrace_push(self, member_name):
         backtraces = [
-            self.asn1_members_backtrace,
-            self.c_members_backtrace
+            self.asn1_backtrace(),
+            self.c_backtrace()
         ]
 
         return _MembersBacktracesContext(backtraces, member_name)
 
     def asn1_members_backtrace_push(self, member_name):
-        backtraces = [self.asn1_members_backtrace]
+        backtraces = [self.asn1_backtrace()]
 
         return _MembersBacktracesContext(backtraces, member_name)
 
     def c_members_backtrace_push(self, member_name):
-        backtraces = [self.c_members_backtrace]
+        backtraces = [self.c_backtrace()]
 
         return _MembersBacktracesContext(backtraces, member_name)
 
+    def asn1_backtrace(self):
+        return (self.asn1_members_backtrace,
+                self.asn1_members_backtrace_joined,
+                '_')
+
+    def c_backtrace(self):
+        return (self.c_members_backtrace,
+                self.c_members_backtrace_joined,
+                '.')
+
     def get_member_checker(self, checker, name):
         for member in checker.members:
             if member.name == name:
@@ -345,18 +380,19 @@ class Generator(object):
             self.base_variables.add(name)
             unique_name = name
 
-        line = fmt.format(unique_name)
-
-        if variable_lines is None:
-            self.encode_variable_lines.append(line)
-            self.decode_variable_lines.append(line)
-        elif variable_lines == 'encode':
-            self.encode_variable_lines.append(line)
-        else:
-            self.decode_variable_lines.append(line)
+        # Variable declarations are formatted once the whole type has
+        # been processed, see format_variable_lines().
+        self.variables.append((variable_lines, fmt, unique_name))
 
         return unique_name
 
+    def format_variable_lines(self, variable_lines):
+        return [
+            fmt.format(unique_name)
+            for scope, fmt, unique_name in self.variables
+            if scope is None or scope == variable_lines
+        ]
+
     def add_unique_encode_variable(self, fmt, name):
         return self.add_unique_variable(fmt, name, 'encode')
 
@@ -632,11 +668,14 @@ class Generator(object):
             compiled_type.type,
             compiled_type.constraints_checker.type)
 
-        if self.encode_variable_lines:
-            encode_lines = self.encode_variable_lines + [''] + encode_lines
+        encode_variable_lines = self.format_variable_lines('encode')
+        decode_variable_lines = self.format_variable_lines('decode')
+
+        if encode_variable_lines:
+            encode_lines = encode_variable_lines + [''] + encode_lines
 
-        if self.decode_variable_lines:
-            decode_lines = self.decode_variable_lines + [''] + decode_lines
+        if decode_variable_lines:
+            decode_lines = decode_variable_lines + [''] + decode_lines
 
         encode_lines = indent_lines(encode_lines) + ['']
         decode_lines = indent_lines(decode_lines) + ['']
@@ -653,9 +692,11 @@ class Generator(object):
 
         for module_name, module in sorted(compiled.modules.items()):
             self.module_name = module_name
+            self.module_name_snake = camel_to_snake_case(module_name)
 
             for type_name, compiled_type in sorted(module.items()):
                 self.type_name = type_name
+                self.type_name_snake = camel_to_snake_case(type_name)
                 self.reset_type()
 
                 type_declaration = self.generate_type_declaration(compiled_type)
@@ -735,12 +776,18 @@ def canonical(value):
 
 
 def camel_to_snake_case(value):
-    value = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', value)
-    value = re.sub(r'(_+)', '_', value)
-    value = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', value).lower()
-    value = canonical(value)
+    try:
+        return _SNAKE_CASE_BY_CAMEL_CASE[value]
+    except KeyError:
+        pass
 
-    return value
+    snake_case = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', value)
+    snake_case = re.sub(r'(_+)', '_', snake_case)
+    snake_case = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', snake_case).lower()
+    snake_case = canonical(snake_case)
+    _SNAKE_CASE_BY_CAMEL_CASE[value] = snake_case
+
+    return snake_case
 
 
 def join_lines(lines, suffix):
@@ -752,22 +799,14 @@ def is_user_type(type_):
 
 
 def strip_blank_lines(lines):
-    try:
-        while lines[0] == '':
-            del lines[0]
-
-        while lines[-1] == '':
-            del lines[-1]
-    except IndexError:
-        pass
-
     stripped = []
 
     for line in lines:
-        if line == '' and stripped[-1] == '':
-            continue
+        if line or (stripped and stripped[-1]):
+            stripped.append(line)
 
-        stripped.append(line)
+    if stripped and not stripped[-1]:
+        stripped.pop()
 
     return stripped
 
@@ -777,13 +816,14 @@ def indent_lines(lines):
 
     for line in lines:
         if line:
-            indented_line = 4 * ' ' + line
-        else:
-            indented_line = line
+            indented_lines.append(4 * ' ' + line)
+        elif indented_lines and indented_lines[-1]:
+            indented_lines.append(line)
 
-        indented_lines.append(indented_line)
+    if indented_lines and not indented_lines[-1]:
+        indented_lines.pop()
 
-    return strip_blank_lines(indented_lines)
+    return indented_lines
 
 
 def dedent_lines(lines):
@@ -797,21 +837,20 @@ def topological_sort(graph):
 
     """
 
-    def recurse(node, path):
-        if node not in path:
-            edges = graph[node]
-
-            for edge in edges:
-                if edge not in path:
-                    path = recurse(edge, path)
+    visited = set()
+    path = []
 
-            path = path + [node]
+    def recurse(node):
+        visited.add(node)
 
-        return path
+        for edge in graph[node]:
+            if edge not in visited:
+                recurse(edge)
 
-    path = []
+        path.append(node)
 
     for node in sorted(graph):
-        path = recurse(node, path)
+        if node not in visited:
+            recurse(node)
 
     return path
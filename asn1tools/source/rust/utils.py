@@ -95,6 +95,13 @@ class _MembersBacktracesContext(object):
 
 class _UserType(object):
 
+    __slots__ = (
+        'type_name',
+        'module_name',
+        'type_code',
+        'used_user_types'
+    )
+
     def __init__(self,
                  type_name,
                  module_name,
@@ -119,7 +126,8 @@ class Generator(object):
         self.used_suffixes_by_base_variables = {}
         self.encode_variable_lines = []
         self.decode_variable_lines = []
-        self.used_user_types = []
+        self.used_user_types = set()
+        self.type_names_by_range = {}
 
     def reset_type(self):
         self.helper_lines = []
@@ -127,7 +135,7 @@ class Generator(object):
         self.used_suffixes_by_base_variables = {}
         self.encode_variable_lines = []
         self.decode_variable_lines = []
-        self.used_user_types = []
+        self.used_user_types = set()
 
     @property
     def module_name_snake(self):
@@ -180,6 +188,11 @@ class Generator(object):
         return length
 
     def format_type_name(self, minimum, maximum):
+        try:
+            return self.type_names_by_range[(minimum, maximum)]
+        except KeyError:
+            pass
+
         length = self.type_length(minimum, maximum)
 
         if minimum >= 0:
@@ -187,6 +200,8 @@ class Generator(object):
         else:
             type_name = 'i{}'.format(length)
 
+        self.type_names_by_range[(minimum, maximum)] = type_name
+
         return type_name
 
     @property
@@ -404,7 +419,7 @@ class Generator(object):
         ]
 
     def format_user_type(self, type_name, module_name):
-        self.used_user_types.append((type_name, module_name))
+        self.used_user_types.add((type_name, module_name))
 
         return ['{}{}'.format(module_name, type_name)]
 
@@ -508,7 +523,7 @@ class Generator(object):
                 user_type = _UserType(type_name,
                                       module_name,
                                       type_declaration + definition,
-                                      self.used_user_types)
+                                      frozenset(self.used_user_types))
                 user_types.append(user_type)
 
         user_types = sort_user_types_by_used_user_types(user_types)
@@ -575,22 +590,14 @@ def is_user_type(type_):
 
 
 def strip_blank_lines(lines):
-    try:
-        while lines[0] == '':
-            del lines[0]
-
-        while lines[-1] == '':
-            del lines[-1]
-    except IndexError:
-        pass
-
     stripped = []
 
     for line in lines:
-        if line == '' and stripped[-1] == '':
-            continue
+        if line or (stripped and stripped[-1]):
+            stripped.append(line)
 
-        stripped.append(line)
+    if stripped and not stripped[-1]:
+        stripped.pop()
 
     return stripped
 
@@ -600,13 +607,14 @@ def indent_lines(lines, width=4):
 
     for line in lines:
         if line:
-            indented_line = width * ' ' + line
-        else:
-            indented_line = line
+            indented_lines.append(width * ' ' + line)
+        elif indented_lines and indented_lines[-1]:
+            indented_lines.append(line)
 
-        indented_lines.append(indented_line)
+    if indented_lines and not indented_lines[-1]:
+        indented_lines.pop()
 
-    return strip_blank_lines(indented_lines)
+    return indented_lines
 
 
 def dedent_lines(lines, width=4):
@@ -614,23 +622,38 @@ def dedent_lines(lines, width=4):
 
 
 def sort_user_types_by_used_user_types(user_types):
-    reversed_sorted_user_types = []
+    """Return given user types sorted so that all used user types are in
+    front of the user types using them. Each user type and dependency
+    is visited once, in name order.
+
+    """
+
+    user_types_by_name_tuple = {}
 
     for user_type in user_types:
         user_type_name_tuple = (user_type.type_name, user_type.module_name)
+        user_types_by_name_tuple[user_type_name_tuple] = user_type
+
+    visited = set()
+    sorted_user_types = []
 
-        # Insert first in the reversed list if there are no types
-        # using this type.
-        insert_index = 0
+    def visit(user_type_name_tuple):
+        if user_type_name_tuple in visited:
+            return
 
-        for i, reversed_sorted_user_type in enumerate(reversed_sorted_user_types, 1):
-            if user_type_name_tuple in reversed_sorted_user_type.used_user_types:
-                if i > insert_index:
-                    insert_index = i
+        visited.add(user_type_name_tuple)
+        user_type = user_types_by_name_tuple[user_type_name_tuple]
 
-        reversed_sorted_user_types.insert(insert_index, user_type)
+        for used_user_type in sorted(user_type.used_user_types):
+            if used_user_type in user_types_by_name_tuple:
+                visit(used_user_type)
+
+        sorted_user_types.append(user_type)
+
+    for user_type in user_types:
+        visit((user_type.type_name, user_type.module_name))
 
-    return reversed(reversed_sorted_user_types)
+    return sorted_user_types
 
 
 def is_inline_member_lines(member_lines):
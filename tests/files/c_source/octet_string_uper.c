@@ -95,6 +95,7 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     ssize_t pos;
     size_t byte_pos;
     size_t pos_in_byte;
+    uint8_t byte;
 
     pos = encoder_alloc(self_p, 8u * size);
 
@@ -108,10 +109,14 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     if (pos_in_byte == 0u) {
         (void)memcpy(&self_p->buf_p[byte_pos], buf_p, size);
     } else {
+        byte = self_p->buf_p[byte_pos];
+
         for (i = 0; i < size; i++) {
-            self_p->buf_p[byte_pos + i] |= (buf_p[i] >> pos_in_byte);
-            self_p->buf_p[byte_pos + i + 1] = (buf_p[i] << (8u - pos_in_byte));
+            self_p->buf_p[byte_pos + i] = (uint8_t)(byte | (buf_p[i] >> pos_in_byte));
+            byte = (uint8_t)(buf_p[i] << (8u - pos_in_byte));
         }
+
+        self_p->buf_p[byte_pos + size] = byte;
     }
 }
 
@@ -166,6 +171,8 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     ssize_t pos;
     size_t byte_pos;
     size_t pos_in_byte;
+    uint8_t byte;
+    uint8_t next_byte;
 
     pos = decoder_free(self_p, 8u * size);
 
@@ -179,9 +186,13 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     if (pos_in_byte == 0) {
         (void)memcpy(buf_p, &self_p->buf_p[byte_pos], size);
     } else {
+        byte = self_p->buf_p[byte_pos];
+
         for (i = 0; i < size; i++) {
-            buf_p[i] = (self_p->buf_p[byte_pos + i] << pos_in_byte);
-            buf_p[i] |= (self_p->buf_p[byte_pos + i + 1] >> (8u - pos_in_byte));
+            next_byte = self_p->buf_p[byte_pos + i + 1];
+            buf_p[i] = (uint8_t)((byte << pos_in_byte)
+                                 | (next_byte >> (8u - pos_in_byte)));
+            byte = next_byte;
         }
     }
 }
@@ -113,6 +113,7 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     ssize_t pos;
     size_t byte_pos;
     size_t pos_in_byte;
+    uint8_t byte;
 
     pos = encoder_alloc(self_p, 8u * size);
 
@@ -126,10 +127,14 @@ static void encoder_append_bytes(struct encoder_t *self_p,
     if (pos_in_byte == 0u) {
         (void)memcpy(&self_p->buf_p[byte_pos], buf_p, size);
     } else {
+        byte = self_p->buf_p[byte_pos];
+
         for (i = 0; i < size; i++) {
-            self_p->buf_p[byte_pos + i] |= (buf_p[i] >> pos_in_byte);
-            self_p->buf_p[byte_pos + i + 1] = (buf_p[i] << (8u - pos_in_byte));
+            self_p->buf_p[byte_pos + i] = (uint8_t)(byte | (buf_p[i] >> pos_in_byte));
+            byte = (uint8_t)(buf_p[i] << (8u - pos_in_byte));
         }
+
+        self_p->buf_p[byte_pos + size] = byte;
     }
 }
 
@@ -187,30 +192,25 @@ static void encoder_append_uint64(struct encoder_t *self_p,
 static void encoder_append_int8(struct encoder_t *self_p,
                                 int8_t value)
 {
-    encoder_append_uint8(self_p, (uint8_t)value + 128);
+    encoder_append_uint8(self_p, (uint8_t)((uint8_t)value ^ 0x80u));
 }
 
 static void encoder_append_int16(struct encoder_t *self_p,
                                  int16_t value)
 {
-    encoder_append_uint16(self_p, (uint16_t)value + 32768);
+    encoder_append_uint16(self_p, (uint16_t)((uint16_t)value ^ 0x8000u));
 }
 
 static void encoder_append_int32(struct encoder_t *self_p,
                                  int32_t value)
 {
-    encoder_append_uint32(self_p, (uint32_t)value + 2147483648);
+    encoder_append_uint32(self_p, (uint32_t)value ^ 0x80000000u);
 }
 
 static void encoder_append_int64(struct encoder_t *self_p,
                                  int64_t value)
 {
-    uint64_t u64_value;
-
-    u64_value = (uint64_t)value;
-    u64_value += 9223372036854775808ull;
-
-    encoder_append_uint64(self_p, u64_value);
+    encoder_append_uint64(self_p, (uint64_t)value ^ 0x8000000000000000ull);
 }
 
 static void encoder_append_bool(struct encoder_t *self_p, bool value)
@@ -222,10 +222,42 @@ static void encoder_append_non_negative_binary_integer(struct encoder_t *self_p,
                                                        uint64_t value,
                                                        size_t size)
 {
-    size_t i;
+    ssize_t pos;
+    size_t byte_pos;
+    size_t pos_in_byte;
+    size_t number_of_bits;
+
+    pos = encoder_alloc(self_p, size);
 
-    for (i = 0; i < size; i++) {
-        encoder_append_bit(self_p, (value >> (size - i - 1)) & 1);
+    if (pos < 0) {
+        return;
+    }
+
+    byte_pos = ((size_t)pos / 8u);
+    pos_in_byte = ((size_t)pos % 8u);
+
+    if ((pos_in_byte != 0u) && (size > 0u)) {
+        number_of_bits = (8u - pos_in_byte);
+
+        if (number_of_bits > size) {
+            number_of_bits = size;
+        }
+
+        size -= number_of_bits;
+        self_p->buf_p[byte_pos] |= (uint8_t)(
+            ((value >> size) & ((1u << number_of_bits) - 1u))
+            << (8u - pos_in_byte - number_of_bits));
+        byte_pos++;
+    }
+
+    while (size >= 8u) {
+        size -= 8u;
+        self_p->buf_p[byte_pos] = (uint8_t)(value >> size);
+        byte_pos++;
+    }
+
+    if (size > 0u) {
+        self_p->buf_p[byte_pos] = (uint8_t)(value << (8u - size));
     }
 }
 
@@ -296,6 +328,8 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     ssize_t pos;
     size_t byte_pos;
     size_t pos_in_byte;
+    uint8_t byte;
+    uint8_t next_byte;
 
     pos = decoder_free(self_p, 8u * size);
 
@@ -309,9 +343,13 @@ static void decoder_read_bytes(struct decoder_t *self_p,
     if (pos_in_byte == 0) {
         (void)memcpy(buf_p, &self_p->buf_p[byte_pos], size);
     } else {
+        byte = self_p->buf_p[byte_pos];
+
         for (i = 0; i < size; i++) {
-            buf_p[i] = (self_p->buf_p[byte_pos + i] << pos_in_byte);
-            buf_p[i] |= (self_p->buf_p[byte_pos + i + 1] >> (8u - pos_in_byte));
+            next_byte = self_p->buf_p[byte_pos + i + 1];
+            buf_p[i] = (uint8_t)((byte << pos_in_byte)
+                                 | (next_byte >> (8u - pos_in_byte)));
+            byte = next_byte;
         }
     }
 }
@@ -364,42 +402,22 @@ static uint64_t decoder_read_uint64(struct decoder_t *self_p)
 
 static int8_t decoder_read_int8(struct decoder_t *self_p)
 {
-    int8_t value;
-
-    value = (int8_t)decoder_read_uint8(self_p);
-    value -= 128;
-
-    return (value);
+    return ((int8_t)(decoder_read_uint8(self_p) ^ 0x80u));
 }
 
 static int16_t decoder_read_int16(struct decoder_t *self_p)
 {
-    int16_t value;
-
-    value = (int16_t)decoder_read_uint16(self_p);
-    value -= 32768;
-
-    return (value);
+    return ((int16_t)(decoder_read_uint16(self_p) ^ 0x8000u));
 }
 
 static int32_t decoder_read_int32(struct decoder_t *self_p)
 {
-    int32_t value;
-
-    value = (int32_t)decoder_read_uint32(self_p);
-    value -= 2147483648;
-
-    return (value);
+    return ((int32_t)(decoder_read_uint32(self_p) ^ 0x80000000u));
 }
 
 static int64_t decoder_read_int64(struct decoder_t *self_p)
 {
-    uint64_t value;
-
-    value = decoder_read_uint64(self_p);
-    value -= 9223372036854775808ull;
-
-    return ((int64_t)value);
+    return ((int64_t)(decoder_read_uint64(self_p) ^ 0x8000000000000000ull));
 }
 
 static bool decoder_read_bool(struct decoder_t *self_p)
@@ -410,14 +428,45 @@ static bool decoder_read_bool(struct decoder_t *self_p)
 static uint64_t decoder_read_non_negative_binary_integer(struct decoder_t *self_p,
                                                          size_t size)
 {
-    size_t i;
+    ssize_t pos;
+    size_t byte_pos;
+    size_t pos_in_byte;
+    size_t number_of_bits;
     uint64_t value;
 
+    pos = decoder_free(self_p, size);
+
+    if (pos < 0) {
+        return (0);
+    }
+
+    byte_pos = ((size_t)pos / 8u);
+    pos_in_byte = ((size_t)pos % 8u);
     value = 0;
 
-    for (i = 0; i < size; i++) {
-        value <<= 1;
-        value |= (uint64_t)decoder_read_bit(self_p);
+    if ((pos_in_byte != 0u) && (size > 0u)) {
+        number_of_bits = (8u - pos_in_byte);
+
+        if (number_of_bits > size) {
+            number_of_bits = size;
+        }
+
+        size -= number_of_bits;
+        value = ((self_p->buf_p[byte_pos] >> (8u - pos_in_byte - number_of_bits))
+                 & ((1u << number_of_bits) - 1u));
+        byte_pos++;
+    }
+
+    while (size >= 8u) {
+        size -= 8u;
+        value <<= 8;
+        value |= self_p->buf_p[byte_pos];
+        byte_pos++;
+    }
+
+    if (size > 0u) {
+        value <<= size;
+        value |= (uint64_t)(self_p->buf_p[byte_pos] >> (8u - size));
     }
 
     return (value);
@@ -463,10 +512,7 @@ static void uper_c_source_ab_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_ab_t *src_p)
 {
-    encoder_append_non_negative_binary_integer(
-        encoder_p,
-        (uint64_t)(src_p->a - -1),
-        1);
+    encoder_append_bit(encoder_p, (int)((uint64_t)(src_p->a - -1)));
     encoder_append_non_negative_binary_integer(
         encoder_p,
         (uint64_t)(src_p->b - 10000),
@@ -477,11 +523,9 @@ static void uper_c_source_ab_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_ab_t *dst_p)
 {
-    dst_p->a = decoder_read_non_negative_binary_integer(
-        decoder_p,
-        1);
+    dst_p->a = (int8_t)decoder_read_bit(decoder_p);
     dst_p->a += -1;
-    dst_p->b = decoder_read_non_negative_binary_integer(
+    dst_p->b = (uint16_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         10);
     dst_p->b += 10000;
@@ -1790,7 +1834,9 @@ static void uper_c_source_q_decode_inner(
 {
     uint16_t choice;
 
-    choice = (uint16_t)decoder_read_non_negative_binary_integer(decoder_p, 9);
+    choice = (uint16_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        9);
 
     switch (choice) {
 
@@ -3092,6 +3138,7 @@ static void uper_c_source_d_encode_inner(
     uint8_t i;
     uint8_t i_2;
     uint16_t value;
+    uint64_t present_mask;
 
     encoder_append_non_negative_binary_integer(
         encoder_p,
@@ -3103,10 +3150,7 @@ static void uper_c_source_d_encode_inner(
 
         case uper_c_source_d_a_b_choice_c_e:
             encoder_append_non_negative_binary_integer(encoder_p, 0, 1);
-            encoder_append_non_negative_binary_integer(
-                encoder_p,
-                (uint64_t)(src_p->elements[i].a.b.value.c - 0),
-                1);
+            encoder_append_bit(encoder_p, (int)((uint64_t)(src_p->elements[i].a.b.value.c - 0)));
             break;
 
         case uper_c_source_d_a_b_choice_d_e:
@@ -3119,10 +3163,7 @@ static void uper_c_source_d_encode_inner(
             break;
         }
 
-        encoder_append_non_negative_binary_integer(
-            encoder_p,
-            src_p->elements[i].a.e.length - 3u,
-            1);
+        encoder_append_bit(encoder_p, (int)(src_p->elements[i].a.e.length - 3u));
 
         for (i_2 = 0; i_2 < src_p->elements[i].a.e.length; i_2++) {
         }
@@ -3144,20 +3185,25 @@ static void uper_c_source_d_encode_inner(
                 encoder_abort(encoder_p, EBADENUM);
                 return;
             }
-            encoder_append_non_negative_binary_integer(encoder_p, value, 2);
+            encoder_append_non_negative_binary_integer(
+                encoder_p,
+                value,
+                2);
         }
 
-        encoder_append_non_negative_binary_integer(
-            encoder_p,
-            src_p->elements[i].g.l.length - 1u,
-            1);
+        encoder_append_bit(encoder_p, (int)(src_p->elements[i].g.l.length - 1u));
         encoder_append_bytes(encoder_p,
                              &src_p->elements[i].g.l.buf[0],
                              src_p->elements[i].g.l.length);
-        encoder_append_bool(encoder_p, src_p->elements[i].m.is_n_present);
-        encoder_append_bool(encoder_p, src_p->elements[i].m.o != 3);
-        encoder_append_bool(encoder_p, src_p->elements[i].m.is_p_present);
-        encoder_append_bool(encoder_p, src_p->elements[i].m.s != false);
+        present_mask = 0;
+        present_mask |= ((uint64_t)(src_p->elements[i].m.is_n_present) << 3);
+        present_mask |= ((uint64_t)(src_p->elements[i].m.o != 3) << 2);
+        present_mask |= ((uint64_t)(src_p->elements[i].m.is_p_present) << 1);
+        present_mask |= ((uint64_t)(src_p->elements[i].m.s != false) << 0);
+        encoder_append_non_negative_binary_integer(
+            encoder_p,
+            present_mask,
+            4);
 
         if (src_p->elements[i].m.is_n_present) {
             encoder_append_bool(encoder_p, src_p->elements[i].m.n);
@@ -3198,6 +3244,7 @@ static void uper_c_source_d_decode_inner(
     uint16_t value;
     bool is_present_2;
     bool is_present_3;
+    uint64_t present_mask;
 
     dst_p->length = decoder_read_non_negative_binary_integer(
         decoder_p,
@@ -3211,15 +3258,13 @@ static void uper_c_source_d_decode_inner(
     }
 
     for (i = 0; i < dst_p->length; i++) {
-        choice = (uint8_t)decoder_read_non_negative_binary_integer(decoder_p, 1);
+        choice = (uint8_t)decoder_read_bit(decoder_p);
 
         switch (choice) {
 
         case 0:
             dst_p->elements[i].a.b.choice = uper_c_source_d_a_b_choice_c_e;
-            dst_p->elements[i].a.b.value.c = decoder_read_non_negative_binary_integer(
-                decoder_p,
-                1);
+            dst_p->elements[i].a.b.value.c = (uint8_t)decoder_read_bit(decoder_p);
             dst_p->elements[i].a.b.value.c += 0;
             break;
 
@@ -3233,9 +3278,7 @@ static void uper_c_source_d_decode_inner(
             break;
         }
 
-        dst_p->elements[i].a.e.length = decoder_read_non_negative_binary_integer(
-            decoder_p,
-            1);
+        dst_p->elements[i].a.e.length = (uint8_t)decoder_read_bit(decoder_p);
         dst_p->elements[i].a.e.length += 3u;
 
         for (i_2 = 0; i_2 < dst_p->elements[i].a.e.length; i_2++) {
@@ -3244,7 +3287,9 @@ static void uper_c_source_d_decode_inner(
         is_present = decoder_read_bool(decoder_p);
 
         if (is_present) {
-            value = decoder_read_non_negative_binary_integer(decoder_p, 2);
+            value = (uint16_t)decoder_read_non_negative_binary_integer(
+                decoder_p,
+                2);
             switch (value) {
             case 0:
                 dst_p->elements[i].g.h = uper_c_source_d_g_h_i_e;
@@ -3263,24 +3308,25 @@ static void uper_c_source_d_decode_inner(
             dst_p->elements[i].g.h = uper_c_source_d_g_h_j_e;
         }
 
-        dst_p->elements[i].g.l.length = decoder_read_non_negative_binary_integer(
-            decoder_p,
-            1);
+        dst_p->elements[i].g.l.length = (uint8_t)decoder_read_bit(decoder_p);
         dst_p->elements[i].g.l.length += 1u;
         decoder_read_bytes(decoder_p,
                            &dst_p->elements[i].g.l.buf[0],
                            dst_p->elements[i].g.l.length);
-        dst_p->elements[i].m.is_n_present = decoder_read_bool(decoder_p);
-        is_present_2 = decoder_read_bool(decoder_p);
-        dst_p->elements[i].m.is_p_present = decoder_read_bool(decoder_p);
-        is_present_3 = decoder_read_bool(decoder_p);
+        present_mask = decoder_read_non_negative_binary_integer(
+            decoder_p,
+            4);
+        dst_p->elements[i].m.is_n_present = (((present_mask >> 3) & 1u) != 0);
+        is_present_2 = (((present_mask >> 2) & 1u) != 0);
+        dst_p->elements[i].m.is_p_present = (((present_mask >> 1) & 1u) != 0);
+        is_present_3 = (((present_mask >> 0) & 1u) != 0);
 
         if (dst_p->elements[i].m.is_n_present) {
             dst_p->elements[i].m.n = decoder_read_bool(decoder_p);
         }
 
         if (is_present_2) {
-            dst_p->elements[i].m.o = decoder_read_non_negative_binary_integer(
+            dst_p->elements[i].m.o = (int8_t)decoder_read_non_negative_binary_integer(
                 decoder_p,
                 3);
             dst_p->elements[i].m.o += -2;
@@ -3330,7 +3376,7 @@ static void uper_c_source_ad_encode_inner(
     uint8_t value;
 
     value = src_p->value;
-    encoder_append_non_negative_binary_integer(encoder_p, value, 1);
+    encoder_append_bit(encoder_p, (int)(value));
 }
 
 static void uper_c_source_ad_decode_inner(
@@ -3339,7 +3385,7 @@ static void uper_c_source_ad_decode_inner(
 {
     uint8_t value;
 
-    value = decoder_read_non_negative_binary_integer(decoder_p, 1);
+    value = (uint8_t)decoder_read_bit(decoder_p);
     dst_p->value = (enum uper_c_source_ad_e)value;
 }
 
@@ -3347,9 +3393,16 @@ static void uper_c_source_ae_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_ae_t *src_p)
 {
+    uint64_t present_mask;
+
     encoder_append_bool(encoder_p, false);
-    encoder_append_bool(encoder_p, src_p->is_a_present);
-    encoder_append_bool(encoder_p, src_p->b != true);
+    present_mask = 0;
+    present_mask |= ((uint64_t)(src_p->is_a_present) << 1);
+    present_mask |= ((uint64_t)(src_p->b != true) << 0);
+    encoder_append_non_negative_binary_integer(
+        encoder_p,
+        present_mask,
+        2);
 
     if (src_p->is_a_present) {
         encoder_append_bool(encoder_p, src_p->a);
@@ -3367,10 +3420,14 @@ static void uper_c_source_ae_decode_inner(
     struct uper_c_source_ae_t *dst_p)
 {
     bool is_present;
+    uint64_t present_mask;
 
     decoder_read_bool(decoder_p);
-    dst_p->is_a_present = decoder_read_bool(decoder_p);
-    is_present = decoder_read_bool(decoder_p);
+    present_mask = decoder_read_non_negative_binary_integer(
+        decoder_p,
+        2);
+    dst_p->is_a_present = (((present_mask >> 1) & 1u) != 0);
+    is_present = (((present_mask >> 0) & 1u) != 0);
 
     if (dst_p->is_a_present) {
         dst_p->a = decoder_read_bool(decoder_p);
@@ -3474,7 +3531,7 @@ static void uper_c_source_aj_encode_inner(
     uint8_t value;
 
     value = src_p->a;
-    encoder_append_non_negative_binary_integer(encoder_p, value, 1);
+    encoder_append_bit(encoder_p, (int)(value));
 }
 
 static void uper_c_source_aj_decode_inner(
@@ -3483,7 +3540,7 @@ static void uper_c_source_aj_decode_inner(
 {
     uint8_t value;
 
-    value = decoder_read_non_negative_binary_integer(decoder_p, 1);
+    value = (uint8_t)decoder_read_bit(decoder_p);
     dst_p->a = (enum uper_c_source_aj_a_e)value;
 }
 
@@ -3510,7 +3567,9 @@ static void uper_c_source_ak_decode_inner(
 {
     uint8_t choice;
 
-    choice = (uint8_t)decoder_read_non_negative_binary_integer(decoder_p, 0);
+    choice = (uint8_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        0);
 
     switch (choice) {
 
@@ -3553,7 +3612,7 @@ static void uper_c_source_al_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_al_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (int16_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         9);
     dst_p->value += -129;
@@ -3563,19 +3622,14 @@ static void uper_c_source_am_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_am_t *src_p)
 {
-    encoder_append_non_negative_binary_integer(
-        encoder_p,
-        (uint64_t)(src_p->value - -2),
-        8);
+    encoder_append_uint8(encoder_p, (uint8_t)((uint64_t)(src_p->value - -2)));
 }
 
 static void uper_c_source_am_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_am_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
-        decoder_p,
-        8);
+    dst_p->value = (int8_t)decoder_read_uint8(decoder_p);
     dst_p->value += -2;
 }
 
@@ -3623,7 +3677,10 @@ static void uper_c_source_an_encode_inner(
         encoder_abort(encoder_p, EBADENUM);
         return;
     }
-    encoder_append_non_negative_binary_integer(encoder_p, value, 4);
+    encoder_append_non_negative_binary_integer(
+        encoder_p,
+        value,
+        4);
 }
 
 static void uper_c_source_an_decode_inner(
@@ -3632,7 +3689,9 @@ static void uper_c_source_an_decode_inner(
 {
     uint32_t value;
 
-    value = decoder_read_non_negative_binary_integer(decoder_p, 4);
+    value = (uint32_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        4);
     switch (value) {
     case 0:
         dst_p->value = uper_c_source_an_a_e;
@@ -3677,10 +3736,7 @@ static void uper_c_source_ao_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_ao_t *src_p)
 {
-    encoder_append_non_negative_binary_integer(
-        encoder_p,
-        (uint64_t)(src_p->a),
-        8);
+    encoder_append_uint8(encoder_p, (uint8_t)((uint64_t)(src_p->a)));
     encoder_append_non_negative_binary_integer(
         encoder_p,
         (uint64_t)(src_p->b),
@@ -3699,9 +3755,7 @@ static void uper_c_source_ao_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_ao_t *dst_p)
 {
-    dst_p->a = decoder_read_non_negative_binary_integer(
-        decoder_p,
-        8);
+    dst_p->a = decoder_read_uint8(decoder_p);
     dst_p->b = decoder_read_non_negative_binary_integer(
         decoder_p,
         24);
@@ -3727,7 +3781,7 @@ static void uper_c_ref_referenced_sequence_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_ref_referenced_sequence_t *dst_p)
 {
-    dst_p->a = decoder_read_non_negative_binary_integer(
+    dst_p->a = (uint8_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         7);
     dst_p->a += 0;
@@ -3740,7 +3794,10 @@ static void uper_c_ref_referenced_enum_encode_inner(
     uint8_t value;
 
     value = src_p->value;
-    encoder_append_non_negative_binary_integer(encoder_p, value, 2);
+    encoder_append_non_negative_binary_integer(
+        encoder_p,
+        value,
+        2);
 }
 
 static void uper_c_ref_referenced_enum_decode_inner(
@@ -3749,7 +3806,9 @@ static void uper_c_ref_referenced_enum_decode_inner(
 {
     uint8_t value;
 
-    value = decoder_read_non_negative_binary_integer(decoder_p, 2);
+    value = (uint8_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        2);
 
     if (value > 2u) {
         decoder_abort(decoder_p, EBADENUM);
@@ -3764,8 +3823,15 @@ static void uper_c_source_ap_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_ap_t *src_p)
 {
-    encoder_append_bool(encoder_p, src_p->c.value != uper_c_ref_referenced_enum_a_e);
-    encoder_append_bool(encoder_p, src_p->d != 1);
+    uint64_t present_mask;
+
+    present_mask = 0;
+    present_mask |= ((uint64_t)(src_p->c.value != uper_c_ref_referenced_enum_a_e) << 1);
+    present_mask |= ((uint64_t)(src_p->d != 1) << 0);
+    encoder_append_non_negative_binary_integer(
+        encoder_p,
+        present_mask,
+        2);
     uper_c_ref_referenced_sequence_encode_inner(encoder_p, &src_p->b);
 
     if (src_p->c.value != uper_c_ref_referenced_enum_a_e) {
@@ -3783,9 +3849,13 @@ static void uper_c_source_ap_decode_inner(
 {
     bool is_present;
     bool is_present_2;
+    uint64_t present_mask;
 
-    is_present = decoder_read_bool(decoder_p);
-    is_present_2 = decoder_read_bool(decoder_p);
+    present_mask = decoder_read_non_negative_binary_integer(
+        decoder_p,
+        2);
+    is_present = (((present_mask >> 1) & 1u) != 0);
+    is_present_2 = (((present_mask >> 0) & 1u) != 0);
     uper_c_ref_referenced_sequence_decode_inner(decoder_p, &dst_p->b);
 
     if (is_present) {
@@ -3833,7 +3903,9 @@ static void uper_c_source_b_decode_inner(
 {
     uint8_t choice;
 
-    choice = (uint8_t)decoder_read_non_negative_binary_integer(decoder_p, 2);
+    choice = (uint8_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        2);
 
     switch (choice) {
 
@@ -3931,13 +4003,17 @@ static void uper_c_source_e_decode_inner(
     uint8_t choice;
     uint8_t choice_2;
 
-    choice = (uint8_t)decoder_read_non_negative_binary_integer(decoder_p, 0);
+    choice = (uint8_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        0);
 
     switch (choice) {
 
     case 0:
         dst_p->a.choice = uper_c_source_e_a_choice_b_e;
-        choice_2 = (uint8_t)decoder_read_non_negative_binary_integer(decoder_p, 0);
+        choice_2 = (uint8_t)decoder_read_non_negative_binary_integer(
+            decoder_p,
+            0);
 
         switch (choice_2) {
 
@@ -3966,10 +4042,7 @@ static void uper_c_source_f_encode_inner(
     uint8_t i;
     uint8_t i_2;
 
-    encoder_append_non_negative_binary_integer(
-        encoder_p,
-        src_p->length - 1u,
-        1);
+    encoder_append_bit(encoder_p, (int)(src_p->length - 1u));
 
     for (i = 0; i < src_p->length; i++) {
         for (i_2 = 0; i_2 < 1; i_2++) {
@@ -3985,9 +4058,7 @@ static void uper_c_source_f_decode_inner(
     uint8_t i;
     uint8_t i_2;
 
-    dst_p->length = decoder_read_non_negative_binary_integer(
-        decoder_p,
-        1);
+    dst_p->length = (uint8_t)decoder_read_bit(decoder_p);
     dst_p->length += 1u;
 
     for (i = 0; i < dst_p->length; i++) {
@@ -4001,15 +4072,22 @@ static void uper_c_source_g_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_g_t *src_p)
 {
-    encoder_append_bool(encoder_p, src_p->is_a_present);
-    encoder_append_bool(encoder_p, src_p->is_b_present);
-    encoder_append_bool(encoder_p, src_p->is_c_present);
-    encoder_append_bool(encoder_p, src_p->is_d_present);
-    encoder_append_bool(encoder_p, src_p->is_e_present);
-    encoder_append_bool(encoder_p, src_p->is_f_present);
-    encoder_append_bool(encoder_p, src_p->is_g_present);
-    encoder_append_bool(encoder_p, src_p->is_h_present);
-    encoder_append_bool(encoder_p, src_p->is_i_present);
+    uint64_t present_mask;
+
+    present_mask = 0;
+    present_mask |= ((uint64_t)(src_p->is_a_present) << 8);
+    present_mask |= ((uint64_t)(src_p->is_b_present) << 7);
+    present_mask |= ((uint64_t)(src_p->is_c_present) << 6);
+    present_mask |= ((uint64_t)(src_p->is_d_present) << 5);
+    present_mask |= ((uint64_t)(src_p->is_e_present) << 4);
+    present_mask |= ((uint64_t)(src_p->is_f_present) << 3);
+    present_mask |= ((uint64_t)(src_p->is_g_present) << 2);
+    present_mask |= ((uint64_t)(src_p->is_h_present) << 1);
+    present_mask |= ((uint64_t)(src_p->is_i_present) << 0);
+    encoder_append_non_negative_binary_integer(
+        encoder_p,
+        present_mask,
+        9);
 
     if (src_p->is_a_present) {
         encoder_append_bool(encoder_p, src_p->a);
@@ -4052,15 +4130,20 @@ static void uper_c_source_g_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_g_t *dst_p)
 {
-    dst_p->is_a_present = decoder_read_bool(decoder_p);
-    dst_p->is_b_present = decoder_read_bool(decoder_p);
-    dst_p->is_c_present = decoder_read_bool(decoder_p);
-    dst_p->is_d_present = decoder_read_bool(decoder_p);
-    dst_p->is_e_present = decoder_read_bool(decoder_p);
-    dst_p->is_f_present = decoder_read_bool(decoder_p);
-    dst_p->is_g_present = decoder_read_bool(decoder_p);
-    dst_p->is_h_present = decoder_read_bool(decoder_p);
-    dst_p->is_i_present = decoder_read_bool(decoder_p);
+    uint64_t present_mask;
+
+    present_mask = decoder_read_non_negative_binary_integer(
+        decoder_p,
+        9);
+    dst_p->is_a_present = (((present_mask >> 8) & 1u) != 0);
+    dst_p->is_b_present = (((present_mask >> 7) & 1u) != 0);
+    dst_p->is_c_present = (((present_mask >> 6) & 1u) != 0);
+    dst_p->is_d_present = (((present_mask >> 5) & 1u) != 0);
+    dst_p->is_e_present = (((present_mask >> 4) & 1u) != 0);
+    dst_p->is_f_present = (((present_mask >> 3) & 1u) != 0);
+    dst_p->is_g_present = (((present_mask >> 2) & 1u) != 0);
+    dst_p->is_h_present = (((present_mask >> 1) & 1u) != 0);
+    dst_p->is_i_present = (((present_mask >> 0) & 1u) != 0);
 
     if (dst_p->is_a_present) {
         dst_p->a = decoder_read_bool(decoder_p);
@@ -4137,10 +4220,7 @@ static void uper_c_source_j_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_j_t *src_p)
 {
-    encoder_append_non_negative_binary_integer(
-        encoder_p,
-        src_p->length - 22u,
-        1);
+    encoder_append_bit(encoder_p, (int)(src_p->length - 22u));
     encoder_append_bytes(encoder_p,
                          &src_p->buf[0],
                          src_p->length);
@@ -4150,9 +4230,7 @@ static void uper_c_source_j_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_j_t *dst_p)
 {
-    dst_p->length = decoder_read_non_negative_binary_integer(
-        decoder_p,
-        1);
+    dst_p->length = (uint8_t)decoder_read_bit(decoder_p);
     dst_p->length += 22u;
     decoder_read_bytes(decoder_p,
                        &dst_p->buf[0],
@@ -4166,7 +4244,10 @@ static void uper_c_source_k_encode_inner(
     uint8_t value;
 
     value = src_p->value;
-    encoder_append_non_negative_binary_integer(encoder_p, value, 0);
+    encoder_append_non_negative_binary_integer(
+        encoder_p,
+        value,
+        0);
 }
 
 static void uper_c_source_k_decode_inner(
@@ -4175,7 +4256,9 @@ static void uper_c_source_k_decode_inner(
 {
     uint8_t value;
 
-    value = decoder_read_non_negative_binary_integer(decoder_p, 0);
+    value = (uint8_t)decoder_read_non_negative_binary_integer(
+        decoder_p,
+        0);
     dst_p->value = (enum uper_c_source_k_e)value;
 }
 
@@ -4306,19 +4389,14 @@ static void uper_c_source_r_encode_inner(
     struct encoder_t *encoder_p,
     const struct uper_c_source_r_t *src_p)
 {
-    encoder_append_non_negative_binary_integer(
-        encoder_p,
-        (uint64_t)(src_p->value - -1),
-        1);
+    encoder_append_bit(encoder_p, (int)((uint64_t)(src_p->value - -1)));
 }
 
 static void uper_c_source_r_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_r_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
-        decoder_p,
-        1);
+    dst_p->value = (int8_t)decoder_read_bit(decoder_p);
     dst_p->value += -1;
 }
 
@@ -4350,7 +4428,7 @@ static void uper_c_source_s_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_s_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (int8_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         2);
     dst_p->value += -2;
@@ -4370,7 +4448,7 @@ static void uper_c_source_t_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_t_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (int8_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         2);
     dst_p->value += -1;
@@ -4390,7 +4468,7 @@ static void uper_c_source_u_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_u_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (int8_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         7);
     dst_p->value += -64;
@@ -4424,7 +4502,7 @@ static void uper_c_source_w_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_w_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (int16_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         9);
     dst_p->value += -1;
@@ -4444,7 +4522,7 @@ static void uper_c_source_x_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_x_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (int16_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         10);
     dst_p->value += -2;
@@ -4464,7 +4542,7 @@ static void uper_c_source_y_decode_inner(
     struct decoder_t *decoder_p,
     struct uper_c_source_y_t *dst_p)
 {
-    dst_p->value = decoder_read_non_negative_binary_integer(
+    dst_p->value = (uint16_t)decoder_read_non_negative_binary_integer(
         decoder_p,
         10);
     dst_p->value += 10000;